@@ -1,9 +1,10 @@
 from beanie import WriteRules
-from beanie.operators import Or
+from beanie.operators import In, Or
 from bson import DBRef
 
 from unipoll_api import AccountManager
-from unipoll_api.documents import Policy, Workspace, Group, Account
+from unipoll_api.documents import Policy, Workspace, Group, Account, Member
+from unipoll_api.mongo_db import BATCH_SIZE
 from unipoll_api import actions
 from unipoll_api.schemas import GroupSchemas, WorkspaceSchemas
 from unipoll_api.exceptions import GroupExceptions, WorkspaceExceptions, ResourceExceptions
@@ -11,32 +12,70 @@ from unipoll_api.utils import Permissions
 from unipoll_api.dependencies import get_member
 
 
+# Empty group list
+EMPTY_GROUP_LIST = GroupSchemas.GroupList(groups=[])
+
+
 # Get list of groups
 async def get_groups(workspace: Workspace | None = None,
                      account: Account | None = None,
                      name: str | None = None) -> GroupSchemas.GroupList:
+    groups = await get_groups_list(workspace, account, name)
+    return GroupSchemas.GroupList.model_construct(groups=groups) if groups else EMPTY_GROUP_LIST
+
+
+# Get list of groups without the GroupList wrapper
+async def get_groups_list(workspace: Workspace | None = None,
+                          account: Account | None = None,
+                          name: str | None = None) -> list[GroupSchemas.GroupShort]:
     account = account or AccountManager.active_user.get()
 
-    search_filter = {}
-    if name:
-        search_filter['name'] = name  # type: ignore
+    # The groups of a workspace are fetched with its links, so they are filtered in memory
     if workspace:
-        search_filter['workspace._id'] = workspace.id  # type: ignore
-    if account:
-        search_filter['members.account._id'] = account.id  # type: ignore
-    search_result = await Group.find(search_filter, fetch_links=True).to_list()
-
-    # TODO: Rewrite to iterate over list of workspaces
-    # TODO: to avoid permission check for every group if the user has permission to get all groups
+        search_result = [group for group in workspace.groups  # type: ignore
+                         if (not name or group.name == name) and _is_member(group, account)]  # type: ignore
+    else:
+        search_result = await _find_groups(account, name)
 
     groups = []
     for group in search_result:
-        try:
-            groups.append((await get_group(group=group)).model_dump(exclude_none=True))
-        except Exception:
-            pass
+        if await _can_get_group(group, workspace or group.workspace):  # type: ignore
+            groups.append(GroupSchemas.GroupShort.model_construct(id=group.id,
+                                                                  name=group.name,
+                                                                  description=group.description))
+    return groups
 
-    return GroupSchemas.GroupList(groups=groups)
+
+# Check if the account is a member of a group fetched with its links
+def _is_member(group: Group, account: Account) -> bool:
+    return any(member.account.id == account.id for member in group.members)  # type: ignore
+
+
+# Check if the user can get a group, with the get_groups permission in the workspace
+# or the get_group permission in the group, same as get_group
+async def _can_get_group(group: Group, workspace: Workspace) -> bool:
+    try:
+        try:
+            await Permissions.check_permissions(workspace, "get_groups")
+        except ResourceExceptions.UserNotAuthorized:
+            await Permissions.check_permissions(group, "get_group")
+    except Exception:
+        return False
+    return True
+
+
+# Find the groups of an account in all workspaces
+# Queries with fetch_links apply their filter after joining every document, so the groups are first
+# selected by the account.$id and members.$id indexes and then fetched by id
+async def _find_groups(account: Account, name: str | None = None) -> list[Group]:
+    member_ids = await Member.distinct("_id", {"account.$id": account.id})
+    search_filter: dict = {"members.$id": {"$in": member_ids}}
+    if name:
+        search_filter["name"] = name
+    group_ids = await Group.distinct("_id", search_filter)
+    if not group_ids:
+        return []
+    return await Group.find(In(Group.id, group_ids), fetch_links=True, batchSize=BATCH_SIZE).to_list()
 
 
 # Create a new group with account as the owner
@@ -88,7 +127,7 @@ async def get_group(group: Group,
         await Permissions.check_permissions(group, "get_group", check_permissions)
 
     members = (await actions.MembersActions.get_members(group)).members if include_members else None
-    policies = (await actions.PolicyActions.get_policies(resource=group)).policies if include_policies else None
+    policies = await actions.PolicyActions.get_policies_list(resource=group) if include_policies else None
     workspace = WorkspaceSchemas.Workspace(**group.workspace.model_dump(exclude={"members",  # type: ignore
                                                                                  "policies",
                                                                                  "groups"}))
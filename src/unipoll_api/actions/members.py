@@ -1,6 +1,6 @@
-from beanie import WriteRules
 from beanie.operators import In
-from unipoll_api.documents import Account, Group, ResourceID, Workspace, Member
+from unipoll_api.documents import Account, Group, ResourceID, Workspace, Member, Policy
+from unipoll_api.mongo_db import BATCH_SIZE
 from unipoll_api.utils import Permissions
 from unipoll_api.schemas import MemberSchemas
 # from unipoll_api import AccountManager
@@ -8,21 +8,30 @@ from unipoll_api.exceptions import ResourceExceptions
 from unipoll_api.dependencies import get_member
 
 
+# Empty member list
+# Empty list responses are shared between requests in all actions, so they must not be modified
+EMPTY_MEMBER_LIST = MemberSchemas.MemberList(members=[])
+
+
+# Build the member schema from a member with a fetched account
+def build_member_scheme(member: Member) -> MemberSchemas.Member:
+    account: Account = member.account  # type: ignore
+    return MemberSchemas.Member.model_construct(id=member.id,
+                                                account_id=account.id,
+                                                first_name=account.first_name,
+                                                last_name=account.last_name,
+                                                email=account.email)
+
+
 async def get_members(resource: Workspace | Group, check_permissions: bool = True) -> MemberSchemas.MemberList:
     # Check if the user has permission to add members
     await Permissions.check_permissions(resource, "get_members", check_permissions)
 
-    def build_member_scheme(member: Member) -> MemberSchemas.Member:
-        account: Account = member.account  # type: ignore
-        return MemberSchemas.Member(id=member.id,
-                                    account_id=account.id,
-                                    first_name=account.first_name,
-                                    last_name=account.last_name,
-                                    email=account.email)
-
+    if not resource.members:
+        return EMPTY_MEMBER_LIST
     member_list = [build_member_scheme(member) for member in resource.members]  # type: ignore
     # Return the list of members
-    return MemberSchemas.MemberList(members=member_list)
+    return MemberSchemas.MemberList.model_construct(members=member_list)
 
 
 # Add groups/members to group
@@ -37,13 +46,13 @@ async def add_members(resource: Workspace | Group,
     # Remove existing members from the accounts set
     accounts = accounts.difference({member.id for member in resource.members})  # type: ignore
     # Find the accounts from the database
-    account_list = await Account.find(In(Account.id, accounts)).to_list()
+    account_list = await Account.find(In(Account.id, accounts), batch_size=BATCH_SIZE).to_list()
     # Add the accounts to the group member list with basic permissions
-
+    default_permissions = eval("Permissions." + resource.get_document_type().upper() + "_BASIC_PERMISSIONS")
     new_members = []
+    policy_count = len(resource.policies)
 
     for account in account_list:
-        default_permissions = eval("Permissions." + resource.get_document_type().upper() + "_BASIC_PERMISSIONS")
         if resource.get_document_type() == "Group":
             member = await get_member(account, resource.workspace)  # type: ignore
             new_member = await resource.add_member(member, default_permissions, save=False)
@@ -51,7 +60,15 @@ async def add_members(resource: Workspace | Group,
         elif resource.get_document_type() == "Workspace":
             new_member = await resource.add_member(account, default_permissions, save=False)
             new_members.append(new_member)
-    await resource.save(link_rule=WriteRules.WRITE)  # type: ignore
+
+    # Insert the new members and policies in bulk, then save only the resource,
+    # instead of saving every linked document of the resource one by one
+    if new_members:
+        new_policies = resource.policies[policy_count:]
+        if resource.get_document_type() == "Workspace":
+            await Member.insert_many(new_members, ordered=False)
+        await Policy.insert_many(new_policies, ordered=False)  # type: ignore
+        await resource.save()  # type: ignore
 
     member_list = []
     for new_member in new_members:
@@ -1,5 +1,6 @@
 from unipoll_api import AccountManager
 from unipoll_api.documents import Account, Workspace, Group, Policy, Resource, Member
+from unipoll_api.mongo_db import BATCH_SIZE
 from unipoll_api.schemas import MemberSchemas, PolicySchemas, GroupSchemas
 from unipoll_api.exceptions import ResourceExceptions
 from unipoll_api.utils import Permissions
@@ -7,6 +8,10 @@ from unipoll_api.utils.permissions import check_permissions
 from unipoll_api.dependencies import get_member
 
 
+# Empty policy list
+EMPTY_POLICY_LIST = PolicySchemas.PolicyList(policies=[])
+
+
 # Helper function to get policies from a resource
 # NOTE: This can be moved to utils
 async def get_policies_from_resource(resource: Resource) -> list[Policy]:
@@ -24,39 +29,56 @@ async def get_policies_from_resource(resource: Resource) -> list[Policy]:
         return policies
 
 
+# Helper function to get the parent resource of a policy
+# Reuses the resource if the caller has already fetched it, instead of fetching it again
+async def get_parent_resource(policy: Policy, resource: Resource | None = None) -> Resource:
+    if resource and resource.id == policy.parent_resource.ref.id:  # type: ignore
+        return resource
+    return await policy.get_parent_resource(fetch_links=True)
+
+
 # Get all policies of a workspace
 async def get_policies(policy_holder: Member | Group | None = None,
                        resource: Resource | None = None) -> PolicySchemas.PolicyList:
+    policy_list = await get_policies_list(policy_holder, resource)
+    return PolicySchemas.PolicyList.model_construct(policies=policy_list) if policy_list else EMPTY_POLICY_LIST
+
+
+# Get list of policies without the PolicyList wrapper
+async def get_policies_list(policy_holder: Member | Group | None = None,
+                            resource: Resource | None = None) -> list[PolicySchemas.PolicyShort]:
     policy_list = []
     policy: Policy
     all_policies = []
 
     # Get policies from a specific resource
     if resource:
-        all_policies = await get_policies_from_resource(resource)
+        all_policies = [(policy, resource) for policy in await get_policies_from_resource(resource)]
     # Get policies from all resources
     else:
-        all_workspaces = Workspace.find(fetch_links=True)
-        all_groups = Group.find(fetch_links=True)
+        all_workspaces = Workspace.find(fetch_links=True, batchSize=BATCH_SIZE)
+        all_groups = Group.find(fetch_links=True, batchSize=BATCH_SIZE)
         all_resources = await all_workspaces.to_list() + await all_groups.to_list()
 
         for resource in all_resources:
-            all_policies += await get_policies_from_resource(resource)
+            all_policies += [(policy, resource) for policy in await get_policies_from_resource(resource)]
 
     # Build policy list
-    for policy in all_policies:
+    for policy, parent_resource in all_policies:
         # Filter by policy_holder if specified
         if policy_holder:
             if (policy.policy_holder.ref.id != policy_holder.id):
                 continue
-        policy_list.append(await get_policy(policy, False))
+        policy_list.append(await get_policy(policy, False, parent_resource))
     # Return policy list
-    return PolicySchemas.PolicyList(policies=policy_list)
+    return policy_list
 
 
-async def get_policy(policy: Policy, permission_check: bool = True) -> PolicySchemas.PolicyShort:
+async def get_policy(policy: Policy,
+                     permission_check: bool = True,
+                     parent_resource: Resource | None = None) -> PolicySchemas.PolicyShort:
     # Get the parent resource of the policy
-    parent_resource = await policy.get_parent_resource(fetch_links=True)
+    parent_resource = await get_parent_resource(policy, parent_resource)
     await check_permissions(parent_resource, "get_policies", permission_check)
 
     # Get the policy holder
@@ -65,32 +87,33 @@ async def get_policy(policy: Policy, permission_check: bool = True) -> PolicySch
     if policy_holder.get_document_type() == "Member":
         await policy_holder.fetch_link("account")
         account: Account = policy_holder.account  # type: ignore
-        member = MemberSchemas.Member(id=policy_holder.id,
-                                      account_id=account.id,
-                                      email=account.email,
-                                      first_name=account.first_name,
-                                      last_name=account.last_name)
+        member = MemberSchemas.Member.model_construct(id=policy_holder.id,
+                                                      account_id=account.id,
+                                                      email=account.email,
+                                                      first_name=account.first_name,
+                                                      last_name=account.last_name)
     elif policy_holder.get_document_type() == "Group":
-        group = GroupSchemas.Group(id=policy_holder.id,
-                                   name=policy_holder.name,
-                                   description=policy_holder.description)
+        group = GroupSchemas.Group.model_construct(id=policy_holder.id,
+                                                   name=policy_holder.name,
+                                                   description=policy_holder.description)
 
     # Get the permissions based on the resource type and convert it to a list of strings
     permission_type = Permissions.PermissionTypes[parent_resource.get_document_type()]
     permissions = permission_type(policy.permissions).name.split('|')  # type: ignore
 
     # Return the policy
-    return PolicySchemas.PolicyShort(id=policy.id,
-                                     policy_holder_type=policy.policy_holder_type,
-                                     policy_holder=member or group,
-                                     permissions=permissions)
+    return PolicySchemas.PolicyShort.model_construct(id=policy.id,
+                                                     policy_holder_type=policy.policy_holder_type,
+                                                     policy_holder=member or group,
+                                                     permissions=permissions)
 
 
 async def update_policy(policy: Policy,
                         new_permissions: list[str],
-                        check_permissions: bool = True) -> PolicySchemas.PolicyOutput:
+                        check_permissions: bool = True,
+                        parent_resource: Resource | None = None) -> PolicySchemas.PolicyOutput:
 
-    parent_resource = await policy.get_parent_resource(fetch_links=True)
+    parent_resource = await get_parent_resource(policy, parent_resource)
 
     # Check if the user has the required permissions to update the policy
     await Permissions.check_permissions(parent_resource, "update_policies", check_permissions)
@@ -1,14 +1,27 @@
 from beanie import WriteRules
 from unipoll_api.documents import Poll, Workspace
+from unipoll_api.mongo_db import BATCH_SIZE
 from unipoll_api.schemas import PollSchemas, QuestionSchemas, WorkspaceSchemas
 from unipoll_api.utils import Permissions
 from unipoll_api.exceptions import ResourceExceptions, PollExceptions
 from unipoll_api import actions
 
 
+# Empty poll list
+EMPTY_POLL_LIST = PollSchemas.PollList(polls=[])
+
+
 async def get_polls(workspace: Workspace | None = None,
                     check_permissions: bool = True) -> PollSchemas.PollList:
-    all_workspaces = [workspace] if workspace else await Workspace.find(fetch_links=True).to_list()
+    poll_list = await get_polls_list(workspace, check_permissions)
+    return PollSchemas.PollList.model_construct(polls=poll_list) if poll_list else EMPTY_POLL_LIST
+
+
+# Get list of polls without the PollList wrapper
+async def get_polls_list(workspace: Workspace | None = None,
+                         check_permissions: bool = True) -> list[PollSchemas.PollShort]:
+    all_workspaces = [workspace] if workspace else await Workspace.find(fetch_links=True,
+                                                                        batchSize=BATCH_SIZE).to_list()
 
     polls = []
     for workspace in all_workspaces:
@@ -23,11 +36,13 @@ async def get_polls(workspace: Workspace | None = None,
                 else:
                     polls.append(await get_poll(poll, check_permissions))  # type: ignore
 
-    poll_list = []
     # Build poll list and return the result
-    for poll in polls:  # type: ignore
-        poll_list.append(PollSchemas.PollShort(**poll.model_dump()))  # type: ignore
-    return PollSchemas.PollList(polls=poll_list)
+    return [PollSchemas.PollShort.model_construct(id=poll.id,
+                                                  name=poll.name,
+                                                  description=poll.description,
+                                                  public=poll.public,
+                                                  published=poll.published)
+            for poll in polls]
 
 
 # Create a new poll in a workspace
@@ -80,7 +95,7 @@ async def get_poll(poll: Poll,
 
     # Fetch the resources if the user has the required permissions
     questions = (await get_poll_questions(poll)).questions if include_questions else None
-    policies = (await actions.PolicyActions.get_policies(resource=poll)).policies if include_policies else None
+    policies = await actions.PolicyActions.get_policies_list(resource=poll) if include_policies else None
 
     workspace = WorkspaceSchemas.WorkspaceShort(**poll.workspace.model_dump())  # type: ignore
 
@@ -1,10 +1,13 @@
+import asyncio
+from beanie.operators import In
 from bson import DBRef
 from unipoll_api import AccountManager
 from unipoll_api import actions
-from unipoll_api.documents import Workspace, Account, Policy, Member
+from unipoll_api.documents import Workspace, Account, Policy, Member, Group, ResourceID, ResourceProjection
+from unipoll_api.mongo_db import BATCH_SIZE
 from unipoll_api.utils import Permissions
-from unipoll_api.schemas import WorkspaceSchemas
-from unipoll_api.exceptions import WorkspaceExceptions
+from unipoll_api.schemas import WorkspaceSchemas, GroupSchemas, MemberSchemas, PolicySchemas
+from unipoll_api.exceptions import WorkspaceExceptions, ResourceExceptions
 # from unipoll_api.dependencies import get_member
 
 
@@ -13,15 +16,20 @@ async def get_workspaces(account: Account | None = None) -> WorkspaceSchemas.Wor
     account = AccountManager.active_user.get() if not account else account
     workspace_list = []
 
-    members = await Member.find(Member.account.id == account.id, fetch_links=True).to_list()
-    workspaces = [member.workspace for member in members]
+    # Queries with fetch_links apply their filter after joining every document, so the workspaces are
+    # selected by the account.$id and members.$id indexes without fetching links
+    member_ids = await Member.distinct("_id", {"account.$id": account.id})
+    workspaces = await Workspace.find(In("members.$id", member_ids),
+                                      projection_model=ResourceProjection,
+                                      batch_size=BATCH_SIZE).to_list()
 
     # Create a workspace list for output schema using the search results
     for workspace in workspaces:
-        workspace_list.append(WorkspaceSchemas.WorkspaceShort(
-            **workspace.model_dump(exclude={'groups', 'permissions'})))
+        workspace_list.append(WorkspaceSchemas.WorkspaceShort.model_construct(id=workspace.id,
+                                                                              name=workspace.name,
+                                                                              description=workspace.description))
 
-    return WorkspaceSchemas.WorkspaceList(workspaces=workspace_list)
+    return WorkspaceSchemas.WorkspaceList.model_construct(workspaces=workspace_list)
 
 
 # Create a new workspace with account as the owner
@@ -51,19 +59,84 @@ async def get_workspace(workspace: Workspace,
                         include_members: bool = False,
                         include_polls: bool = False,
                         check_permissions: bool = True) -> WorkspaceSchemas.Workspace:
-    await Permissions.check_permissions(workspace, "get_workspace", check_permissions)
-    groups = (await actions.GroupActions.get_groups(workspace)).groups if include_groups else None
-    members = (await actions.MembersActions.get_members(workspace)).members if include_members else None
-    policies = (await actions.PolicyActions.get_policies(resource=workspace)).policies if include_policies else None
-    polls = (await actions.PollActions.get_polls(workspace)).polls if include_polls else None
+    # Check access to the workspace and the requested resources concurrently
+    _, _, can_get_policies = await asyncio.gather(
+        Permissions.check_permissions(workspace, "get_workspace", check_permissions),
+        Permissions.check_permissions(workspace, "get_members", check_permissions and include_members),
+        _has_permission(workspace, "get_policies", check_permissions and include_policies))
+
+    # Groups, polls and the policies of users who can't read all of them are fetched by the resource actions,
+    # which filter them by membership and permissions
+    fetches = {}
+    if include_groups:
+        fetches["groups"] = actions.GroupActions.get_groups_list(workspace)
+    if include_policies and not can_get_policies:
+        fetches["policies"] = actions.PolicyActions.get_policies_list(resource=workspace)
+    if include_polls:
+        fetches["polls"] = actions.PollActions.get_polls_list(workspace)
+    results = dict(zip(fetches, await asyncio.gather(*fetches.values())))
+
+    # The workspace is fetched with its links, so members and policy holders are already in memory
+    members, policies = None, None
+    if include_members:
+        members = [actions.MembersActions.build_member_scheme(member) for member in workspace.members]  # type: ignore
+    if include_policies:
+        policies = results.get("policies")
+        if policies is None:
+            policies = await _get_policies(workspace)
     # Return the workspace with the fetched resources
-    return WorkspaceSchemas.Workspace(id=workspace.id,
-                                      name=workspace.name,
-                                      description=workspace.description,
-                                      groups=groups,
-                                      members=members,
-                                      policies=policies,
-                                      polls=polls)
+    # The data comes from validated documents, so the schema is constructed without validation
+    return WorkspaceSchemas.Workspace.model_construct(id=workspace.id,
+                                                      name=workspace.name,
+                                                      description=workspace.description,
+                                                      groups=results.get("groups"),
+                                                      members=members,
+                                                      policies=policies,
+                                                      polls=results.get("polls"))
+
+
+# Check a permission without raising an exception
+async def _has_permission(workspace: Workspace, permission: str, check_permissions: bool = True) -> bool:
+    try:
+        await Permissions.check_permissions(workspace, permission, check_permissions)
+        return True
+    except ResourceExceptions.UserNotAuthorized:
+        return False
+
+
+# Get all policies of a workspace, resolving policy holders from the fetched members and groups
+async def _get_policies(workspace: Workspace) -> list[PolicySchemas.PolicyShort]:
+    members = {member.id: member for member in workspace.members}  # type: ignore
+    groups = {group.id: group for group in workspace.groups}  # type: ignore
+    policies = []
+    for policy in workspace.policies:
+        policy_short = _build_policy(policy, members, groups)  # type: ignore
+        # Fetch the policy holder if it is not a member or a group of the workspace
+        if not policy_short:
+            policy_short = await actions.PolicyActions.get_policy(policy, False, workspace)  # type: ignore
+        policies.append(policy_short)
+    return policies
+
+
+def _build_policy(policy: Policy,
+                  members: dict[ResourceID, Member],
+                  groups: dict[ResourceID, Group]) -> PolicySchemas.PolicyShort | None:
+    holder_id = policy.policy_holder.ref.id  # type: ignore
+    policy_holder: MemberSchemas.Member | GroupSchemas.Group
+    if policy.policy_holder_type == "Member" and holder_id in members:
+        policy_holder = actions.MembersActions.build_member_scheme(members[holder_id])
+    elif policy.policy_holder_type == "Group" and holder_id in groups:
+        group = groups[holder_id]
+        policy_holder = GroupSchemas.Group.model_construct(id=group.id,
+                                                           name=group.name,
+                                                           description=group.description)
+    else:
+        return None
+    permissions = Permissions.WorkspacePermissions(policy.permissions).name.split('|')  # type: ignore
+    return PolicySchemas.PolicyShort.model_construct(id=policy.id,
+                                                     policy_holder_type=policy.policy_holder_type,
+                                                     policy_holder=policy_holder,
+                                                     permissions=permissions)
 
 
 # Update a workspace
@@ -2,13 +2,15 @@ import json
 import uvicorn
 import os
 import argparse
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 from fastapi.middleware.cors import CORSMiddleware
 from beanie import init_beanie
 from unipoll_api.routes import router
 from unipoll_api.mongo_db import mainDB, documentModels
 from unipoll_api.config import get_settings
+from unipoll_api.exceptions.resource import APIException
 from unipoll_api.__version__ import version
 from unipoll_api.utils import cli_args, colored_dbg
 
@@ -21,11 +23,19 @@ app = FastAPI(
     title=settings.app_name,               # Title of the application
     description=settings.app_description,  # Description of the application
     version=settings.app_version,          # Version of the application
+    default_response_class=ORJSONResponse  # Encode responses with orjson
 )
 
 # Add endpoints defined in the routes directory
 app.include_router(router)
 
+
+# Convert exceptions raised by actions and dependencies to HTTP responses
+@app.exception_handler(APIException)
+async def api_exception_handler(request: Request, exc: APIException) -> ORJSONResponse:
+    return ORJSONResponse(status_code=exc.code, content={"detail": str(exc)})
+
+
 # Add CORS middleware to allow cross-origin requests
 origins = settings.origins.split(",")
 
@@ -53,6 +63,9 @@ async def on_startup() -> None:
         document_models=documentModels  # type: ignore
     )
 
+    # Ping the database to open the connection pool before the first request
+    await mainDB.command("ping")
+
 
 # Run the application
 def start_server(host: str = settings.host, port: int = settings.port, reload: bool = settings.reload):
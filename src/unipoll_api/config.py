@@ -22,6 +22,12 @@ class Settings(BaseSettings):  # type: ignore
                                   title="Admin Email", description="The email address of the API administrator.")
     mongodb_url: str = Field(default="mongodb://localhost:27017",
                              title="MongoDB URL", description="The URL of the MongoDB database.")
+    mongodb_min_pool_size: int = Field(default=10, title="MongoDB Min Pool Size",
+                                       description="The number of connections to keep open to the database.")
+    mongodb_max_pool_size: int = Field(default=50, title="MongoDB Max Pool Size",
+                                       description="The maximum number of concurrent connections to the database.")
+    mongodb_max_idle_time_ms: int = Field(default=300000, title="MongoDB Max Idle Time",
+                                          description="Time in milliseconds before an idle connection is closed.")
     secrete_key: str = Field(default="secret", title="Secrete Key", description="The secrete key of the API.")
     origins: str = "*"
     host: str = "0.0.0.0"
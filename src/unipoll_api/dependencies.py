@@ -1,25 +1,13 @@
 from typing import Annotated
-from functools import wraps
 # from bson import DBRef
-from fastapi import Cookie, Depends, Query, HTTPException, WebSocket
+from fastapi import Cookie, Depends, Query, WebSocket
 from unipoll_api.account_manager import active_user, get_current_active_user
 from unipoll_api.documents import ResourceID, Workspace, Group, Account, Poll, Policy, Member
 from unipoll_api import exceptions as Exceptions
-
-
-# Wrapper to handle exceptions and raise HTTPException
-def http_dependency(func):
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except Exceptions.ResourceExceptions.APIException as e:
-            raise HTTPException(status_code=e.code, detail=str(e))
-    return wrapper
+from unipoll_api.utils.permissions import permissions_cache
 
 
 # Dependency to get account by id
-@http_dependency
 async def get_account(account_id: ResourceID) -> Account:
     """
     Returns an account with the given id.
@@ -48,7 +36,6 @@ async def websocket_auth(websocket: WebSocket,
 
 
 # Dependency for getting a workspace with the given id
-@http_dependency
 async def get_workspace(workspace_id: ResourceID) -> Workspace:
     """
     Returns a workspace with the given id.
@@ -61,7 +48,6 @@ async def get_workspace(workspace_id: ResourceID) -> Workspace:
 
 
 # Dependency to get a group by id and verify it exists
-@http_dependency
 async def get_group(group_id: ResourceID) -> Group:
     """
     Returns a group with the given id.
@@ -73,7 +59,6 @@ async def get_group(group_id: ResourceID) -> Group:
 
 
 # Dependency to get a poll by id and verify it exists
-@http_dependency
 async def get_poll(poll_id: ResourceID) -> Poll:
     """
     Returns a poll with the given id.
@@ -85,7 +70,6 @@ async def get_poll(poll_id: ResourceID) -> Poll:
 
 
 # Dependency to get a policy by id and verify it exists
-@http_dependency
 async def get_policy(policy_id: ResourceID) -> Policy:
     policy = await Policy.get(policy_id, fetch_links=True)
     if policy:
@@ -97,4 +81,5 @@ async def get_policy(policy_id: ResourceID) -> Policy:
 # Dependency to get a user by id and verify it exists
 async def set_active_user(user_account: Account = Depends(get_current_active_user)):
     active_user.set(user_account)
+    permissions_cache.set({})
     return user_account
@@ -1,10 +1,12 @@
 # from typing import ForwardRef, NewType, TypeAlias, Optional
-from typing import Literal
+from typing import Annotated, Literal
 from bson import DBRef
 from beanie import Document as BeanieDocument
 from beanie import BackLink, WriteRules, after_event, Insert, Link, PydanticObjectId  # BackLink
+from beanie import Delete, Replace, Save, SaveChanges, Update
 from fastapi_users_db_beanie import BeanieBaseUser
-from pydantic import Field
+from pydantic import BaseModel, Field
+from pymongo import IndexModel
 from unipoll_api.utils import colored_dbg as Debug
 from unipoll_api.utils.token_db import BeanieBaseAccessToken
 
@@ -24,6 +26,11 @@ async def create_link(document: Document) -> Link:
     return link
 
 
+# Constraints for the first and last name of an account
+# pydantic-core compiles the pattern once, when a model using this type is created
+AccountName = Annotated[str, Field(max_length=20, min_length=2, pattern=r"^[A-Z][a-z]*$")]
+
+
 # Custom PydanticObjectId class to override due to a bug
 class ResourceID(PydanticObjectId):
     @classmethod
@@ -34,6 +41,13 @@ class ResourceID(PydanticObjectId):
         )
 
 
+# Projection of the resource fields used by the short output schemas
+class ResourceProjection(BaseModel):
+    id: ResourceID = Field(alias="_id")
+    name: str
+    description: str = ""
+
+
 class AccessToken(BeanieBaseAccessToken, Document):  # type: ignore
     pass
 
@@ -49,6 +63,12 @@ class Resource(Document):
     def create_group(self) -> None:
         Debug.info(f'New {self.get_document_type()} "{self.id}" has been created')
 
+    # Permissions are computed from the policies of resources, so cached permissions are outdated
+    @after_event(Insert, Replace, Save, SaveChanges, Update, Delete)
+    def clear_permissions_cache(self) -> None:
+        from unipoll_api.utils.permissions import clear_permissions_cache
+        clear_permissions_cache()
+
     async def add_policy(self, policy_holder: "Group | Member", permissions, save: bool = True) -> "Policy":
         new_policy = Policy(policy_holder_type=policy_holder.get_document_type(),  # type: ignore
                             policy_holder=(await create_link(policy_holder)),
@@ -78,16 +98,8 @@ class Resource(Document):
 
 class Account(BeanieBaseUser, Document):  # type: ignore
     id: ResourceID = Field(default_factory=ResourceID, alias="_id")
-    first_name: str = Field(
-        default_factory=str,
-        max_length=20,
-        min_length=2,
-        pattern="^[A-Z][a-z]*$")
-    last_name: str = Field(
-        default_factory=str,
-        max_length=20,
-        min_length=2,
-        pattern="^[A-Z][a-z]*$")
+    first_name: AccountName = Field(default_factory=str)
+    last_name: AccountName = Field(default_factory=str)
 
 
 class Workspace(Resource):
@@ -95,8 +107,14 @@ class Workspace(Resource):
     groups: list[Link["Group"]] = []
     polls: list[Link["Poll"]] = []
 
+    class Settings:
+        indexes = [IndexModel("name"),
+                   IndexModel("members.$id")]
+
+    # The new member and policy are written to the database when the workspace is saved,
+    # if save is False, the caller is responsible for inserting them
     async def add_member(self, account: "Account", permissions, save: bool = True) -> "Member":
-        new_member = await Member(account=account, resource=(await create_link(self))).create()  # type: ignore
+        new_member = Member(account=account)  # type: ignore
         new_policy = await self.add_policy(new_member, permissions, save=False)  # type: ignore
         new_member.policies.append(new_policy)  # type: ignore
 
@@ -136,6 +154,9 @@ class Group(Resource):
     members: list[Link["Member"]] = []
     groups: list[Link["Group"]] = []
 
+    class Settings:
+        indexes = [IndexModel("members.$id")]
+
     async def add_member(self, member: "Member", permissions, save: bool = True) -> "Member":
         if member.workspace.id != self.workspace.id:  # type: ignore
             from unipoll_api.exceptions import WorkspaceExceptions
@@ -182,6 +203,15 @@ class Policy(Document):
     policy_holder: Link["Group"] | Link["Member"]
     permissions: int
 
+    @after_event(Insert, Replace, Save, SaveChanges, Update, Delete)
+    def clear_permissions_cache(self) -> None:
+        from unipoll_api.utils.permissions import clear_permissions_cache
+        clear_permissions_cache()
+
+    class Settings:
+        indexes = [IndexModel("parent_resource"),
+                   IndexModel("policy_holder")]
+
     async def get_parent_resource(self, fetch_links: bool = False) -> Workspace | Group | Poll:
         from unipoll_api.exceptions.resource import ResourceNotFound
         collection = eval(self.parent_resource.ref.collection)
@@ -208,3 +238,6 @@ class Member(Document):
     workspace: BackLink[Workspace] = Field(original_field="members")  # type: ignore
     groups: list[BackLink[Group]] = Field(original_field="members")  # type: ignore
     policies: list[Link[Policy]] = []
+
+    class Settings:
+        indexes = [IndexModel("account.$id")]
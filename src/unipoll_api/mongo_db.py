@@ -5,13 +5,23 @@ from unipoll_api.config import get_settings
 
 settings = get_settings()
 
+# The connection pool is filled up to minPoolSize in the background,
+# so the first requests do not have to wait for new connections
 client: AgnosticClient = AsyncIOMotorClient(
     host=settings.mongodb_url,
     uuidRepresentation="standard",
+    minPoolSize=settings.mongodb_min_pool_size,
+    maxPoolSize=settings.mongodb_max_pool_size,
+    maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
 )
 
 mainDB = client["unipoll-api"]
 
+# Number of documents returned per batch by queries that read lists of documents
+# MongoDB returns only 101 documents in the first batch by default, which requires
+# additional round-trips for larger workspaces
+BATCH_SIZE = 500
+
 documentModels = [
     Documents.AccessToken,
     Documents.Resource,
@@ -1,7 +1,6 @@
-from fastapi import APIRouter, status, HTTPException, Depends
+from fastapi import APIRouter, status, Depends
 from unipoll_api.account_manager import fastapi_users
 from unipoll_api.actions import AccountActions
-from unipoll_api.exceptions.resource import APIException
 from unipoll_api.documents import Account
 from unipoll_api.dependencies import get_account
 from unipoll_api.schemas import AccountSchemas
@@ -14,11 +13,8 @@ router: APIRouter = APIRouter()
 @router.get("",
             response_model=AccountSchemas.AccountList)
 async def get_all_accounts():
-    try:
-        accounts = [AccountSchemas.AccountShort(**a.model_dump()) for a in await Account.find_all().to_list()]
-        return AccountSchemas.AccountList(accounts=accounts)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    accounts = [AccountSchemas.AccountShort(**a.model_dump()) for a in await Account.find_all().to_list()]
+    return AccountSchemas.AccountList(accounts=accounts)
 
 
 # Delete current user account
@@ -38,10 +34,7 @@ async def delete_my_account():
 
         **204** - *The account has been deleted*
     """
-    try:
-        await AccountActions.delete_account()
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    await AccountActions.delete_account()
 
 
 # Delete user account by id
@@ -61,10 +54,7 @@ async def delete_user(account: Account = Depends(get_account)):
 
         **204** - *The account has been deleted*
     """
-    try:
-        await AccountActions.delete_account(account)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    await AccountActions.delete_account(account)
 
 
 # Update current user account
@@ -12,7 +12,6 @@ from unipoll_api import account_manager as AccountManager
 from unipoll_api.actions import authentication as AuthActions
 # from unipoll_api.schemas import authentication as AuthSchemas
 from unipoll_api.schemas import account as AccountSchemas
-from unipoll_api.exceptions.resource import APIException
 from unipoll_api.utils.token_db import BeanieAccessTokenDatabase
 router: APIRouter = APIRouter()
 
@@ -77,10 +76,7 @@ async def refresh_jwt(authorization: Annotated[str, Header(...)],
         authorization: `Authorization` header with the access token
         refresh_token: `Refresh-Token` header with the refresh token
     """
-    try:
-        return await AuthActions.refresh_token(authorization, refresh_token)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=e.detail)
+    return await AuthActions.refresh_token(authorization, refresh_token)
 
 
 # Refresh the access token using the refresh token and Client ID
@@ -96,15 +92,12 @@ async def refresh_jwt_with_client_ID(authorization: Annotated[str, Header(...)],
     Body:
         refresh_token: `Refresh-Token` header with the refresh token
     """
-    try:
-        # import json
-        # print(body.decode('utf-8'))
-        # body = json.loads(body.decode('utf-8'))
-        # print(body)
-        # AuthSchemas.PostmanRefreshTokenRequest(**body)
-        return await AuthActions.refresh_token_with_clientID(authorization, body, token_db, strategy)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=e.detail)
+    # import json
+    # print(body.decode('utf-8'))
+    # body = json.loads(body.decode('utf-8'))
+    # print(body)
+    # AuthSchemas.PostmanRefreshTokenRequest(**body)
+    return await AuthActions.refresh_token_with_clientID(authorization, body, token_db, strategy)
 
 
 # Include prebuilt routes for authentication
@@ -1,9 +1,8 @@
 # FastAPI
 from typing import Annotated, Literal
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, Query, Response, status
 from unipoll_api import dependencies as Dependencies
 from unipoll_api.actions import GroupActions, PermissionsActions, MembersActions, PolicyActions
-from unipoll_api.exceptions.resource import APIException
 from unipoll_api.schemas import GroupSchemas, PolicySchemas, MemberSchemas
 from unipoll_api.documents import Account, Group, Policy, ResourceID
 
@@ -31,11 +30,8 @@ async def get_all_groups(workspace: Annotated[ResourceID | None, Query()] = None
                   response_description="Created Group",
                   response_model=GroupSchemas.GroupCreateOutput)
 async def create_group(input_data: GroupSchemas.GroupCreateRequest = Body(...)):
-    try:
-        workspace = await Dependencies.get_workspace(input_data.workspace)
-        return await GroupActions.create_group(workspace, name=input_data.name, description=input_data.description)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    workspace = await Dependencies.get_workspace(input_data.workspace)
+    return await GroupActions.create_group(workspace, name=input_data.name, description=input_data.description)
 
 
 query_params = list[Literal["policies", "members", "all"]]
@@ -49,19 +45,16 @@ query_params = list[Literal["policies", "members", "all"]]
             response_model_exclude_none=True)
 async def get_group(group: Group = Depends(Dependencies.get_group),
                     include: Annotated[query_params | None, Query()] = None):
-    try:
-        params = {}
-        if include:
-            if "all" in include:
-                params = {"include_members": True, "include_policies": True}
-            else:
-                if "members" in include:
-                    params["include_members"] = True
-                if "policies" in include:
-                    params["include_policies"] = True
-        return await GroupActions.get_group(group, **params)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    params = {}
+    if include:
+        if "all" in include:
+            params = {"include_members": True, "include_policies": True}
+        else:
+            if "members" in include:
+                params["include_members"] = True
+            if "policies" in include:
+                params["include_policies"] = True
+    return await GroupActions.get_group(group, **params)
 
 
 # Update group info
@@ -70,10 +63,7 @@ async def get_group(group: Group = Depends(Dependencies.get_group),
               response_model=GroupSchemas.GroupShort)
 async def update_group(group_data: GroupSchemas.GroupUpdateRequest,
                        group: Group = Depends(Dependencies.get_group)):
-    try:
-        return await GroupActions.update_group(group, group_data)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await GroupActions.update_group(group, group_data)
 
 
 # Delete a group
@@ -81,23 +71,20 @@ async def update_group(group_data: GroupSchemas.GroupUpdateRequest,
                status_code=status.HTTP_204_NO_CONTENT,
                response_description="Delete a group")
 async def delete_group(group: Group = Depends(Dependencies.get_group)):
-    try:
-        await GroupActions.delete_group(group)
-        return status.HTTP_204_NO_CONTENT
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    await GroupActions.delete_group(group)
+    return status.HTTP_204_NO_CONTENT
 
 
 # Get a list of group members
+# The list is built from validated documents, so it is serialized directly instead of
+# being validated again against the response model
 @router.get("/{group_id}/members",
             response_description="List of group members",
-            response_model=MemberSchemas.MemberList,
-            response_model_exclude_unset=True)
-async def get_group_members(group: Group = Depends(Dependencies.get_group)):
-    try:
-        return await MembersActions.get_members(group)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+            response_model=None,
+            responses={200: {"model": MemberSchemas.MemberList}})
+async def get_group_members(group: Group = Depends(Dependencies.get_group)) -> Response:
+    member_list = await MembersActions.get_members(group)
+    return Response(member_list.model_dump_json(exclude_unset=True), media_type="application/json")
 
 
 # Add member to group
@@ -106,10 +93,7 @@ async def get_group_members(group: Group = Depends(Dependencies.get_group)):
              response_model=MemberSchemas.MemberList)
 async def add_group_members(member_data: MemberSchemas.AddMembers,
                             group: Group = Depends(Dependencies.get_group)):
-    try:
-        return await MembersActions.add_members(group, member_data.accounts)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await MembersActions.add_members(group, member_data.accounts)
 
 
 # Remove members from the workspace
@@ -118,10 +102,7 @@ async def add_group_members(member_data: MemberSchemas.AddMembers,
                response_model_exclude_unset=True)
 async def remove_group_member(group: Group = Depends(Dependencies.get_group),
                               account: Account = Depends(Dependencies.get_account)):
-    try:
-        return await MembersActions.remove_member(group, account)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await MembersActions.remove_member(group, account)
 
 
 # List all policies in the workspace
@@ -130,12 +111,9 @@ async def remove_group_member(group: Group = Depends(Dependencies.get_group),
             response_model=PolicySchemas.PolicyList)
 async def get_group_policies(group: Group = Depends(Dependencies.get_group),
                              account_id: ResourceID = Query(None)) -> PolicySchemas.PolicyList:
-    try:
-        account = await Dependencies.get_account(account_id) if account_id else None
-        member = await Dependencies.get_member(account, group) if account else None
-        return await PolicyActions.get_policies(resource=group, policy_holder=member)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    account = await Dependencies.get_account(account_id) if account_id else None
+    member = await Dependencies.get_member(account, group) if account else None
+    return await PolicyActions.get_policies(resource=group, policy_holder=member)
 
 
 # Set permissions for a user in a group
@@ -153,10 +131,9 @@ async def set_group_policy(group: Group = Depends(Dependencies.get_group),
     - **user_id** (str): id of the user to update
     - **permissions** (int): new permissions for the user
     """
-    try:
-        return await PolicyActions.update_policy(policy, new_permissions=permissions.permissions)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await PolicyActions.update_policy(policy,
+                                             new_permissions=permissions.permissions,
+                                             parent_resource=group)
 
 
 # Get All Group Permissions
@@ -164,7 +141,4 @@ async def set_group_policy(group: Group = Depends(Dependencies.get_group),
                  response_description="List of all Group permissions",
                  response_model=PolicySchemas.PermissionList)
 async def get_group_permissions():
-    try:
-        return await PermissionsActions.get_group_permissions()
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await PermissionsActions.get_group_permissions()
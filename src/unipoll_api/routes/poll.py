@@ -1,10 +1,9 @@
 # APIRouter creates path operations for user module
 from typing import Annotated, Literal
-from fastapi import APIRouter, Body, Depends, Query, HTTPException
+from fastapi import APIRouter, Body, Depends, Query
 
 from unipoll_api import dependencies as Dependencies
 from unipoll_api.documents import Poll
-from unipoll_api.exceptions.resource import APIException
 from unipoll_api.actions import PollActions
 from unipoll_api.schemas import PollSchemas, QuestionSchemas, PolicySchemas
 from unipoll_api import actions
@@ -23,19 +22,16 @@ query_params = list[Literal["all", "questions", "policies"]]
             response_model_exclude_none=True)
 async def get_poll(poll: Poll = Depends(Dependencies.get_poll),
                    include: Annotated[query_params | None, Query()] = None):
-    try:
-        params = {}
-        if include:
-            if "all" in include:
-                params = {"include_questions": True, "include_policies": True}
-            else:
-                if "questions" in include:
-                    params = {"include_questions": True}
-                if "policies" in include:
-                    params = {"include_policies": True}
-        return await PollActions.get_poll(poll, **params)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    params = {}
+    if include:
+        if "all" in include:
+            params = {"include_questions": True, "include_policies": True}
+        else:
+            if "questions" in include:
+                params = {"include_questions": True}
+            if "policies" in include:
+                params = {"include_policies": True}
+    return await PollActions.get_poll(poll, **params)
 
 
 # Update poll details
@@ -45,10 +41,7 @@ async def get_poll(poll: Poll = Depends(Dependencies.get_poll),
               response_model_exclude_none=True)
 async def update_poll(poll: Poll = Depends(Dependencies.get_poll),
                       data: PollSchemas.UpdatePollRequest = Body(...)):
-    try:
-        return await PollActions.update_poll(poll, data)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await PollActions.update_poll(poll, data)
 
 
 # Delete poll by id
@@ -56,10 +49,7 @@ async def update_poll(poll: Poll = Depends(Dependencies.get_poll),
                response_description="Result of delete operation",
                status_code=204)
 async def delete_poll(poll: Poll = Depends(Dependencies.get_poll)):
-    try:
-        return await PollActions.delete_poll(poll)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await PollActions.delete_poll(poll)
 
 
 # Get list of questions in a poll
@@ -69,10 +59,7 @@ async def delete_poll(poll: Poll = Depends(Dependencies.get_poll)):
             response_model_exclude_none=True)
 async def get_questions(poll: Poll = Depends(Dependencies.get_poll),
                         include: Annotated[query_params | None, Query()] = None):
-    try:
-        return await PollActions.get_poll_questions(poll)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await PollActions.get_poll_questions(poll)
 
 
 @router.get("/{poll_id}/policies",
@@ -81,7 +68,4 @@ async def get_questions(poll: Poll = Depends(Dependencies.get_poll),
             response_model_exclude_none=True)
 async def get_policies(poll: Poll = Depends(Dependencies.get_poll),
                        include: Annotated[query_params | None, Query()] = None):
-    try:
-        return await actions.PolicyActions.get_policies(resource=poll)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.PolicyActions.get_policies(resource=poll)
@@ -1,9 +1,9 @@
 # FastAPI
+from itertools import combinations
 from typing import Annotated, Literal
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, Query, Response, status
 from unipoll_api import dependencies as Dependencies
 from unipoll_api import actions
-from unipoll_api.exceptions.resource import APIException
 from unipoll_api.documents import Account, Workspace, ResourceID, Policy
 from unipoll_api.schemas import WorkspaceSchemas, PolicySchemas, GroupSchemas, MemberSchemas, PollSchemas
 
@@ -23,10 +23,7 @@ async def get_workspaces():
     Returns all workspaces where the current user is a member.
     The request does not accept any query parameters.
     """
-    try:
-        return await actions.WorkspaceActions.get_workspaces()
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.WorkspaceActions.get_workspaces()
 
 
 # Create a new workspace for current user
@@ -43,13 +40,26 @@ async def create_workspace(input_data: WorkspaceSchemas.WorkspaceCreateInput = B
 
     Returns the created workspace information.
     """
-    try:
-        return await actions.WorkspaceActions.create_workspace(input_data=input_data)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.WorkspaceActions.create_workspace(input_data=input_data)
 
 
 query_params = list[Literal["all", "policies", "groups", "members", "polls"]]
+include_resources = ("groups", "members", "policies", "polls")
+
+
+# Arguments of WorkspaceActions.get_workspace for every combination of the include query parameter,
+# "all" is expanded to every resource, so the lookup at request time replaces the branching
+def _build_include_params() -> dict[frozenset[str], dict[str, bool]]:
+    include_params = {}
+    for n in range(len(include_resources) + 1):
+        for combo in combinations(include_resources, n):
+            include_params[frozenset(combo)] = {f"include_{resource}": True for resource in combo}
+            include_params[frozenset(combo + ("all",))] = {f"include_{resource}": True
+                                                           for resource in include_resources}
+    return include_params
+
+
+include_params = _build_include_params()
 
 
 # Get a workspace with the given id
@@ -90,27 +100,8 @@ async def get_workspace(workspace: Workspace = Depends(Dependencies.get_workspac
     ### Response:
     Returns a workspace with the given id.
     """
-    try:
-        params = {}
-        if include:
-            if "all" in include:
-                params = {"include_groups": True,
-                          "include_members": True,
-                          "include_policies": True,
-                          "include_polls": True}
-            else:
-                if "groups" in include:
-                    params["include_groups"] = True
-                if "members" in include:
-                    params["include_members"] = True
-                if "policies" in include:
-                    params["include_policies"] = True
-                if "polls" in include:
-                    params["include_polls"] = True
-        return await actions.WorkspaceActions.get_workspace(workspace, **params)
-
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    params = include_params[frozenset(include or ())]
+    return await actions.WorkspaceActions.get_workspace(workspace, **params)
 
 
 # Update a workspace with the given id
@@ -130,10 +121,7 @@ async def update_workspace(workspace: Workspace = Depends(Dependencies.get_works
 
     Returns the updated workspace.
     """
-    try:
-        return await actions.WorkspaceActions.update_workspace(workspace, input_data)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.WorkspaceActions.update_workspace(workspace, input_data)
 
 
 # Delete a workspace with the given id
@@ -149,11 +137,8 @@ async def delete_workspace(workspace: Workspace = Depends(Dependencies.get_works
     Returns status code 204 if the workspace is deleted successfully.
     Response has no detail.
     """
-    try:
-        await actions.WorkspaceActions.delete_workspace(workspace)
-        return status.HTTP_204_NO_CONTENT
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    await actions.WorkspaceActions.delete_workspace(workspace)
+    return status.HTTP_204_NO_CONTENT
 
 
 # List all groups in the workspace
@@ -161,10 +146,7 @@ async def delete_workspace(workspace: Workspace = Depends(Dependencies.get_works
             response_description="List of all groups",
             response_model=GroupSchemas.GroupList)
 async def get_groups(workspace: Workspace = Depends(Dependencies.get_workspace)):
-    try:
-        return await actions.GroupActions.get_groups(workspace)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.GroupActions.get_groups(workspace)
 
 
 # List all groups in the workspace
@@ -174,22 +156,19 @@ async def get_groups(workspace: Workspace = Depends(Dependencies.get_workspace))
              response_model=GroupSchemas.GroupCreateOutput)
 async def create_group(workspace: Workspace = Depends(Dependencies.get_workspace),
                        input_data: GroupSchemas.GroupCreateInput = Body(...)):
-    try:
-        return await actions.GroupActions.create_group(workspace, input_data.name, input_data.description)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.GroupActions.create_group(workspace, input_data.name, input_data.description)
 
 
 # List all members in the workspace
+# The list is built from validated documents, so it is serialized directly instead of
+# being validated again against the response model
 @router.get("/{workspace_id}/members",
             response_description="List of all groups",
-            response_model=MemberSchemas.MemberList,
-            response_model_exclude_unset=True)
-async def get_workspace_members(workspace: Workspace = Depends(Dependencies.get_workspace)):
-    try:
-        return await actions.MembersActions.get_members(workspace)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+            response_model=None,
+            responses={200: {"model": MemberSchemas.MemberList}})
+async def get_workspace_members(workspace: Workspace = Depends(Dependencies.get_workspace)) -> Response:
+    member_list = await actions.MembersActions.get_members(workspace)
+    return Response(member_list.model_dump_json(exclude_unset=True), media_type="application/json")
 
 
 # Add members to the workspace
@@ -198,10 +177,7 @@ async def get_workspace_members(workspace: Workspace = Depends(Dependencies.get_
              response_model=MemberSchemas.MemberList)
 async def add_workspace_members(workspace: Workspace = Depends(Dependencies.get_workspace),
                                 member_data: MemberSchemas.AddMembers = Body(...)):
-    try:
-        return await actions.MembersActions.add_members(workspace, member_data.accounts)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.MembersActions.add_members(workspace, member_data.accounts)
 
 
 # Remove member from the workspace
@@ -210,10 +186,7 @@ async def add_workspace_members(workspace: Workspace = Depends(Dependencies.get_
                response_model_exclude_unset=True)
 async def remove_workspace_member(workspace: Workspace = Depends(Dependencies.get_workspace),
                                   account: Account = Depends(Dependencies.get_account)):
-    try:
-        return await actions.MembersActions.remove_member(workspace, account)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.MembersActions.remove_member(workspace, account)
 
 
 # List all policies in the workspace
@@ -222,12 +195,9 @@ async def remove_workspace_member(workspace: Workspace = Depends(Dependencies.ge
             response_model=PolicySchemas.PolicyList)
 async def get_workspace_policies(workspace: Workspace = Depends(Dependencies.get_workspace),
                                  account_id: ResourceID = Query(None)):
-    try:
-        account = await Dependencies.get_account(account_id) if account_id else None
-        member = await Dependencies.get_member(account, workspace) if account else None
-        return await actions.PolicyActions.get_policies(resource=workspace, policy_holder=member)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    account = await Dependencies.get_account(account_id) if account_id else None
+    member = await Dependencies.get_member(account, workspace) if account else None
+    return await actions.PolicyActions.get_policies(resource=workspace, policy_holder=member)
 
 
 # Set permissions for a member in a workspace
@@ -247,10 +217,9 @@ async def set_workspace_policy(workspace: Workspace = Depends(Dependencies.get_w
 
     Returns the updated workspace.
     """
-    try:
-        return await actions.PolicyActions.update_policy(policy, new_permissions=permissions.permissions)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.PolicyActions.update_policy(policy,
+                                                     new_permissions=permissions.permissions,
+                                                     parent_resource=workspace)
 
 
 # Get All Workspace Permissions
@@ -258,10 +227,7 @@ async def set_workspace_policy(workspace: Workspace = Depends(Dependencies.get_w
                  response_description="List of all workspace permissions",
                  response_model=PolicySchemas.PermissionList)
 async def get_workspace_permissions():
-    try:
-        return await actions.PermissionsActions.get_workspace_permissions()
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.PermissionsActions.get_workspace_permissions()
 
 
 # Get Workspace Polls
@@ -270,10 +236,7 @@ async def get_workspace_permissions():
             response_model=PollSchemas.PollList,
             response_model_exclude_none=True)
 async def get_polls(workspace: Workspace = Depends(Dependencies.get_workspace)):
-    try:
-        return await actions.PollActions.get_polls(workspace)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.PollActions.get_polls(workspace)
 
 
 # Create a new poll in the workspace
@@ -283,7 +246,4 @@ async def get_polls(workspace: Workspace = Depends(Dependencies.get_workspace)):
              response_model=PollSchemas.PollResponse)
 async def create_poll(workspace: Workspace = Depends(Dependencies.get_workspace),
                       input_data: PollSchemas.CreatePollRequest = Body(...)):
-    try:
-        return await actions.PollActions.create_poll(workspace, input_data)
-    except APIException as e:
-        raise HTTPException(status_code=e.code, detail=str(e))
+    return await actions.PollActions.create_poll(workspace, input_data)
@@ -1,21 +1,13 @@
 from fastapi_users import schemas
 from pydantic import ConfigDict, BaseModel, Field, EmailStr
-from unipoll_api.documents import ResourceID
+from unipoll_api.documents import AccountName, ResourceID
 
 
 class Account(schemas.BaseUser[ResourceID]):
     id: ResourceID = Field(...)
     email: EmailStr = Field(...)
-    first_name: str = Field(
-        default_factory=str,
-        max_length=20,
-        min_length=2,
-        pattern="^[A-Z][a-z]*$")
-    last_name: str = Field(
-        default_factory=str,
-        max_length=20,
-        min_length=2,
-        pattern="^[A-Z][a-z]*$")
+    first_name: AccountName = Field(default_factory=str)
+    last_name: AccountName = Field(default_factory=str)
     model_config = ConfigDict(json_schema_extra={
         "example": {
             "email": "user@example.com",
@@ -28,7 +20,7 @@ class Account(schemas.BaseUser[ResourceID]):
 
 class AccountShort(BaseModel):
     id: ResourceID
-    email: EmailStr
+    email: str
     first_name: str
     last_name: str
 
@@ -39,16 +31,8 @@ class AccountList(BaseModel):
 
 class CreateAccount(schemas.BaseUserCreate):
     email: EmailStr = Field(...)
-    first_name: str = Field(
-        default_factory=str,
-        max_length=20,
-        min_length=2,
-        pattern="^[A-Z][a-z]*$")
-    last_name: str = Field(
-        default_factory=str,
-        max_length=20,
-        min_length=2,
-        pattern="^[A-Z][a-z]*$")
+    first_name: AccountName = Field(default_factory=str)
+    last_name: AccountName = Field(default_factory=str)
     model_config = ConfigDict(json_schema_extra={
         "example": {
             "email": "user@example.com",
@@ -61,16 +45,8 @@ class CreateAccount(schemas.BaseUserCreate):
 
 class UpdateAccount(schemas.BaseUserUpdate):
     email: EmailStr = Field(...)
-    first_name: str = Field(
-        default_factory=str,
-        max_length=20,
-        min_length=2,
-        pattern="^[A-Z][a-z]*$")
-    last_name: str = Field(
-        default_factory=str,
-        max_length=20,
-        min_length=2,
-        pattern="^[A-Z][a-z]*$")
+    first_name: AccountName = Field(default_factory=str)
+    last_name: AccountName = Field(default_factory=str)
     model_config = ConfigDict(json_schema_extra={
         "example": {
             "email": "user@example.com",
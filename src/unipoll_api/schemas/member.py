@@ -1,13 +1,14 @@
 from typing import Optional
-from pydantic import ConfigDict, BaseModel, EmailStr, Field, root_validator
+from pydantic import ConfigDict, BaseModel, Field, root_validator
 from unipoll_api.documents import ResourceID
 
 
 # Schema for the response with basic member info
+# The email comes from a validated account, so it is not validated again with EmailStr
 class Member(BaseModel):
     id: ResourceID
     account_id: Optional[ResourceID] = None
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     model_config = ConfigDict(json_schema_extra={
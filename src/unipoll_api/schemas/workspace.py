@@ -25,6 +25,13 @@ class WorkspaceShort(BaseModel):
     id: ResourceID = Field(title="ID")
     name: str = Field(title="Name")
     description: str = Field(title="Description")
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "id": "1a2b3c4d5e6f7g8h9i0j",
+            "name": "Workspace 01",
+            "description": "This is an example workspace",
+        }
+    })
 
 
 # Schema for the response with a list of workspaces
@@ -74,13 +81,5 @@ class WorkspaceUpdateRequest(BaseModel):
 
 
 # Schema for the response when a workspace is created
-class WorkspaceCreateOutput(BaseModel):
-    id: ResourceID = Field(title="ID")
-    name: str = Field(title="Name")
-    description: str = Field(title="Description")
-    model_config = ConfigDict(json_schema_extra={
-        "example": {
-            "name": "Workspace 01",
-            "description": "This is an example workspace",
-        }
-    })
+# The fields are the same as WorkspaceShort, so both share the same validator and serializer
+WorkspaceCreateOutput = WorkspaceShort
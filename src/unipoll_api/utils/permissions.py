@@ -1,4 +1,7 @@
+import asyncio
+from contextvars import ContextVar
 from enum import IntFlag
+from functools import lru_cache
 import unipoll_api
 from unipoll_api import exceptions
 
@@ -88,11 +91,44 @@ def compare_permissions(user_permission: Permissions, required_permission: Permi
     Returns:
         bool: True if the user has the required permission, False otherwise.
     """
-    return bool((user_permission & required_permission) == required_permission)
+    # Compare plain integers, bitwise operations on IntFlag members create new enum members
+    required = int(required_permission)
+    return (int(user_permission) & required) == required
 
 
-# TODO: Rename
+# Permissions computed during the current request, keyed by (resource id, member id)
+# set_active_user starts an empty cache for every request, so permissions are never shared between requests,
+# the cache is also cleared whenever a resource or a policy is written, see clear_permissions_cache()
+permissions_cache: ContextVar[dict[tuple, asyncio.Task] | None] = ContextVar("permissions_cache", default=None)
+
+
+def clear_permissions_cache() -> None:
+    cache = permissions_cache.get()
+    if cache:
+        cache.clear()
+
+
+# Get the permissions of a member in a resource, reusing the permissions computed earlier in the request
+# Concurrent checks of the same permissions share a single computation
 async def get_all_permissions(resource, member) -> Permissions:
+    cache = permissions_cache.get()
+    if cache is None:
+        return await compute_all_permissions(resource, member)
+
+    key = (resource.id, member.id)
+    task = cache.get(key)
+    if not task:
+        task = cache[key] = asyncio.ensure_future(compute_all_permissions(resource, member))
+    try:
+        return await task
+    except Exception:
+        if cache.get(key) is task:
+            del cache[key]
+        raise
+
+
+# Compute the permissions of a member in a resource from the resource policies
+async def compute_all_permissions(resource, member) -> Permissions:
     permission_sum = 0
     # print("resource: ", resource.name)
     # await resource.fetch_link("policies")
@@ -146,6 +182,14 @@ def convert_string_to_permission(resource_type: str, string: str):
         raise ValueError("Invalid permission string")
 
 
+# Combine permission names into a single permission of the resource type
+# The result is cached, since only a handful of combinations are checked on every request
+@lru_cache()
+def get_required_permission(resource_type: str, permissions: tuple[str, ...]) -> Permissions:
+    permissions_list = [convert_string_to_permission(resource_type, p) for p in permissions]
+    return PermissionTypes[resource_type](sum(permissions_list))  # type: ignore
+
+
 async def check_permissions(resource, required_permissions: str | list[str] | None = None, permission_check=True):
     if permission_check and required_permissions:
         account = unipoll_api.AccountManager.active_user.get()  # Get the active user
@@ -157,8 +201,7 @@ async def check_permissions(resource, required_permissions: str | list[str] | No
         if isinstance(required_permissions, str):  # If only one permission is required
             required_permissions = [required_permissions]
 
-        permissions_list = [convert_string_to_permission(resource.get_document_type(), p) for p in required_permissions]
-        required_permission = eval(resource.get_document_type() + "Permissions")(sum(permissions_list))
+        required_permission = get_required_permission(resource.get_document_type(), tuple(required_permissions))
 
         if not compare_permissions(user_permissions, required_permission):
             actions = ", ".join([" ".join([j.capitalize() for j in i.split("_")]) for i in required_permissions])
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+from unipoll_api import dependencies as Dependencies
+from unipoll_api.documents import ResourceID
+from unipoll_api.utils import permissions as Permissions
+
+
+def test_compare_permissions():
+    required = Permissions.get_required_permission("Workspace", ("get_workspace", "get_members"))
+    assert Permissions.compare_permissions(Permissions.WORKSPACE_ALL_PERMISSIONS, required)
+    assert Permissions.compare_permissions(Permissions.WORKSPACE_BASIC_PERMISSIONS, required)
+    assert Permissions.compare_permissions(int(Permissions.WORKSPACE_BASIC_PERMISSIONS), required)
+    assert not Permissions.compare_permissions(Permissions.WorkspacePermissions["get_workspace"], required)
+    assert not Permissions.compare_permissions(0, required)
+
+
+async def test_permissions_cache():
+    member = SimpleNamespace(id=ResourceID())
+    policy = SimpleNamespace(policy_holder_type="Member",
+                             policy_holder=SimpleNamespace(id=member.id),
+                             permissions=int(Permissions.WORKSPACE_BASIC_PERMISSIONS))
+    resource = SimpleNamespace(id=ResourceID(), policies=[policy])
+
+    # Without a request cache the permissions are computed on every call
+    assert await Permissions.get_all_permissions(resource, member) == Permissions.WORKSPACE_BASIC_PERMISSIONS
+    policy.permissions = int(Permissions.WORKSPACE_ALL_PERMISSIONS)
+    assert await Permissions.get_all_permissions(resource, member) == Permissions.WORKSPACE_ALL_PERMISSIONS
+
+    # Cached permissions are returned until the cache is cleared
+    token = Permissions.permissions_cache.set({})
+    try:
+        assert await Permissions.get_all_permissions(resource, member) == Permissions.WORKSPACE_ALL_PERMISSIONS
+        policy.permissions = int(Permissions.WORKSPACE_BASIC_PERMISSIONS)
+        assert await Permissions.get_all_permissions(resource, member) == Permissions.WORKSPACE_ALL_PERMISSIONS
+        Permissions.clear_permissions_cache()
+        assert await Permissions.get_all_permissions(resource, member) == Permissions.WORKSPACE_BASIC_PERMISSIONS
+    finally:
+        Permissions.permissions_cache.reset(token)
+
+    # Every request starts with an empty cache
+    await Dependencies.set_active_user(SimpleNamespace(id=ResourceID()))  # type: ignore
+    assert Permissions.permissions_cache.get() == {}
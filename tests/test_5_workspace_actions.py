@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+from beanie.odm.utils.projection import get_projection
+from bson import DBRef
+from unipoll_api import AccountManager
+from unipoll_api.actions import GroupActions, WorkspaceActions
+from unipoll_api.documents import ResourceID, ResourceProjection
+from unipoll_api.schemas import GroupSchemas
+from unipoll_api.utils import permissions as Permissions
+
+
+def create_member(first_name: str = "John", last_name: str = "Doe"):
+    account = SimpleNamespace(id=ResourceID(), email=f"{first_name}@example.com".lower(),
+                              first_name=first_name, last_name=last_name)
+    return SimpleNamespace(id=ResourceID(), account=account)
+
+
+def create_group(name: str = "Group", members: list | None = None, policies: list | None = None):
+    return SimpleNamespace(id=ResourceID(), name=name, description=f"{name} description",
+                           members=members or [], policies=policies or [], get_document_type=lambda: "Group")
+
+
+def create_policy(policy_holder, policy_holder_type: str, permissions=Permissions.WORKSPACE_BASIC_PERMISSIONS):
+    return SimpleNamespace(id=ResourceID(),
+                           policy_holder_type=policy_holder_type,
+                           policy_holder=SimpleNamespace(ref=DBRef(policy_holder_type, policy_holder.id)),
+                           permissions=int(permissions))
+
+
+def test_resource_projection():
+    # Only the fields of the short output schemas are read from the database
+    assert get_projection(ResourceProjection) == {"_id": 1, "name": 1, "description": 1}
+    workspace_id = ResourceID()
+    workspace = ResourceProjection.model_validate({"_id": workspace_id, "name": "Workspace", "description": ""})
+    assert workspace.id == workspace_id and workspace.name == "Workspace"
+
+
+def test_build_policy_member_holder():
+    member = create_member()
+    policy = create_policy(member, "Member")
+
+    policy_short = WorkspaceActions._build_policy(policy, {member.id: member}, {})  # type: ignore
+    assert policy_short
+    assert policy_short.id == policy.id
+    assert policy_short.policy_holder_type == "Member"
+    assert policy_short.policy_holder.id == member.id
+    assert policy_short.policy_holder.account_id == member.account.id
+    assert policy_short.policy_holder.email == member.account.email
+    assert policy_short.permissions == Permissions.WORKSPACE_BASIC_PERMISSIONS.name.split('|')  # type: ignore
+
+
+def test_build_policy_group_holder():
+    group = create_group()
+    policy = create_policy(group, "Group", Permissions.WORKSPACE_ALL_PERMISSIONS)
+
+    policy_short = WorkspaceActions._build_policy(policy, {}, {group.id: group})  # type: ignore
+    assert policy_short
+    assert policy_short.policy_holder_type == "Group"
+    assert policy_short.policy_holder.id == group.id
+    assert policy_short.policy_holder.name == group.name
+    assert policy_short.permissions == Permissions.WORKSPACE_ALL_PERMISSIONS.name.split('|')  # type: ignore
+
+
+def test_build_policy_unknown_holder():
+    member, group = create_member(), create_group()
+    # Holders are matched by id and type, anything else is left to be fetched
+    member_policy, group_policy = create_policy(member, "Member"), create_policy(group, "Group")
+    assert WorkspaceActions._build_policy(member_policy, {}, {group.id: group}) is None  # type: ignore
+    assert WorkspaceActions._build_policy(group_policy, {group.id: member}, {}) is None  # type: ignore
+
+
+async def test_get_workspace_includes(monkeypatch):
+    member, other_member = create_member(), create_member("Jane")
+    group, other_group = create_group(), create_group("Other")
+    workspace = SimpleNamespace(id=ResourceID(), name="Workspace", description="",
+                                members=[member, other_member],
+                                groups=[group, other_group],
+                                policies=[create_policy(member, "Member"), create_policy(group, "Group")])
+
+    # Groups come from the group actions, which only return the groups visible to the user
+    visible_groups = [GroupSchemas.GroupShort.model_construct(id=group.id, name=group.name,
+                                                              description=group.description)]
+
+    async def get_groups_list(*args, **kwargs):
+        return visible_groups
+    monkeypatch.setattr(GroupActions, "get_groups_list", get_groups_list)
+
+    result = await WorkspaceActions.get_workspace(workspace,  # type: ignore
+                                                  include_groups=True,
+                                                  include_members=True,
+                                                  include_policies=True,
+                                                  check_permissions=False)
+    assert result.groups == visible_groups
+    assert [m.id for m in result.members] == [member.id, other_member.id]  # type: ignore
+    assert [p.policy_holder.id for p in result.policies] == [member.id, group.id]  # type: ignore
+    assert result.polls is None
+
+    result = await WorkspaceActions.get_workspace(workspace, check_permissions=False)  # type: ignore
+    assert result.groups is None and result.members is None and result.policies is None
+
+
+async def test_get_groups_list_visibility():
+    member, other_member = create_member(), create_member("Jane")
+    # Groups of the user, with and without the get_group permission, and a group the user is not in
+    group = create_group("Group", [member], [create_policy(member, "Member", Permissions.GROUP_BASIC_PERMISSIONS)])
+    other_group = create_group("Other", [member, other_member])
+    foreign_group = create_group("Foreign", [other_member],
+                                 [create_policy(member, "Member", Permissions.GROUP_BASIC_PERMISSIONS)])
+    workspace_policy = create_policy(member, "Member")
+    workspace = SimpleNamespace(id=ResourceID(), members=[member, other_member], policies=[workspace_policy],
+                                groups=[group, other_group, foreign_group], get_document_type=lambda: "Workspace")
+    AccountManager.active_user.set(member.account)
+
+    groups = await GroupActions.get_groups_list(workspace)  # type: ignore
+    assert [g.id for g in groups] == [group.id]
+
+    # The get_groups permission in the workspace gives access to all groups of the user
+    workspace_policy.permissions = int(Permissions.WORKSPACE_ALL_PERMISSIONS)
+    groups = await GroupActions.get_groups_list(workspace)  # type: ignore
+    assert [g.id for g in groups] == [group.id, other_group.id]
+    groups = await GroupActions.get_groups_list(workspace, name="Other")  # type: ignore
+    assert [g.id for g in groups] == [other_group.id]
@@ -0,0 +1,41 @@
+from fastapi import Depends, FastAPI, status
+from httpx import AsyncClient
+from unipoll_api.app import api_exception_handler
+from unipoll_api.documents import ResourceID
+from unipoll_api.exceptions import ResourceExceptions, WorkspaceExceptions
+
+workspace_id = ResourceID()
+
+# Application with the API exception handler and routes raising exceptions from a dependency
+app = FastAPI()
+app.add_exception_handler(ResourceExceptions.APIException, api_exception_handler)  # type: ignore
+
+
+async def get_missing_workspace():
+    raise WorkspaceExceptions.WorkspaceNotFound(workspace_id)
+
+
+async def get_broken_workspace():
+    raise ResourceExceptions.InternalServerError("Database error")
+
+
+@app.get("/missing")
+async def get_missing(workspace=Depends(get_missing_workspace)):
+    return workspace
+
+
+@app.get("/broken")
+async def get_broken(workspace=Depends(get_broken_workspace)):
+    return workspace
+
+
+async def test_api_exception_handler():
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/missing")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": f"Workspace #{workspace_id} does not exist"}
+
+        # The details of internal errors are not sent to the client
+        response = await client.get("/broken")
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json() == {"detail": "Internal Server Error"}